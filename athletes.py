@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compact athlete name lookup shared by the scoreboard server and reports
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def display_name(attrs: Dict[str, Any]) -> str:
+    """
+    Build an athlete's display name from their resource attributes
+
+    Names are interned since the same swimmer shows up across many heats.
+    """
+    first_name = attrs.get("displayFirstName") or attrs.get("firstName") or ""
+    last_name = attrs.get("lastName") or ""
+    if first_name and last_name:
+        return sys.intern(first_name + " " + last_name)
+    return sys.intern(first_name or last_name)
+
+
+@dataclass
+class Athletes:
+    """Athlete names stored as parallel lists, addressed through an ID index"""
+
+    index: Dict[str, int] = field(default_factory=dict)
+    first_names: List[Optional[str]] = field(default_factory=list)
+    last_names: List[Optional[str]] = field(default_factory=list)
+    display_names: List[str] = field(default_factory=list)
+
+    def add(self, athlete: Dict[str, Any]) -> None:
+        """Add an athlete resource; a later entry for the same ID replaces it"""
+        athlete_id = athlete.get("id")
+        attrs = athlete.get("attributes", {})
+        first_name = attrs.get("firstName")
+        last_name = attrs.get("lastName")
+        name = display_name(attrs)
+
+        position = self.index.get(athlete_id)
+        if position is None:
+            self.index[athlete_id] = len(self.display_names)
+            self.first_names.append(first_name)
+            self.last_names.append(last_name)
+            self.display_names.append(name)
+        else:
+            self.first_names[position] = first_name
+            self.last_names[position] = last_name
+            self.display_names[position] = name
+
+    def extend(self, athlete_list: Iterable[Dict[str, Any]]) -> None:
+        """Add every athlete resource in a JSON:API data list"""
+        for athlete in athlete_list:
+            self.add(athlete)
+
+    def display(self, athlete_id: Optional[str], default: str = "Unknown") -> str:
+        """Return an athlete's display name, or default if the ID is unknown"""
+        position = self.index.get(athlete_id)
+        if position is None:
+            return default
+        return self.display_names[position]
+
+    def __len__(self) -> int:
+        return len(self.display_names)
+
+    def __contains__(self, athlete_id: object) -> bool:
+        return athlete_id in self.index
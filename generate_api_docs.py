@@ -3,12 +3,23 @@
 Generate API documentation from cached API responses
 """
 
-import json
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from typing import Any, Dict, List, Set
 
+import ijson
+import orjson
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DT_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+_TS_RE = re.compile(r"_\d{8}_\d{6}\.json$")
+_ID_RE = re.compile(r"/ID(?=/|$)")
+_UUID_RE = re.compile(r"/UUID(?=/|$)")
+_IDWORD_RE = re.compile(r"\bId\b")
+
 
 def infer_type(value: Any) -> str:
     """Infer the type of a value"""
@@ -21,12 +32,20 @@ def infer_type(value: Any) -> str:
     if isinstance(value, float):
         return "number"
     if isinstance(value, str):
-        # Check for date formats
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
-            return "date"
-        if re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", value):
-            return "datetime"
-        if value.startswith("http://") or value.startswith("https://"):
+        # Check for date formats (cheap shape test before the regex)
+        length = len(value)
+        if length >= 10 and value[4] == "-" and value[7] == "-":
+            if length == 10 and _DATE_RE.match(value):
+                return "date"
+            if (
+                length >= 19
+                and value[10] == "T"
+                and value[13] == ":"
+                and value[16] == ":"
+                and _DT_RE.match(value)
+            ):
+                return "datetime"
+        if value.startswith(("http://", "https://")):
             return "url"
         return "string"
     if isinstance(value, list):
@@ -44,9 +63,15 @@ def infer_type(value: Any) -> str:
 
 def extract_endpoint_info(filename: str) -> Dict[str, str]:
     """Extract endpoint information from filename"""
-    # Remove timestamp and extension
-    name = re.sub(r"_\d{8}_\d{6}\.json$", "", filename)
+    # Remove timestamp and extension; files captured at different times
+    # share the same template name and therefore the same cached info
+    name = _TS_RE.sub("", filename)
+    return dict(_endpoint_info_for_template(name))
+
 
+@functools.lru_cache(maxsize=None)
+def _endpoint_info_for_template(name: str) -> Dict[str, str]:
+    """Extract endpoint information from a timestamp-stripped filename"""
     # Convert to endpoint path
     if name == "oauth_token":
         return {"path": "/oauth/token", "method": "POST", "name": "OAuth Token"}
@@ -54,12 +79,12 @@ def extract_endpoint_info(filename: str) -> Dict[str, str]:
     if name.startswith("v3_"):
         # Replace _ID and _UUID with path parameters
         path = "/" + name.replace("_", "/")
-        path = re.sub(r"/ID(?=/|$)", "/{id}", path)
-        path = re.sub(r"/UUID(?=/|$)", "/{id}", path)
+        path = _ID_RE.sub("/{id}", path)
+        path = _UUID_RE.sub("/{id}", path)
 
         # Create human-readable name
         endpoint_name = name.replace("v3_", "").replace("_", " ").title()
-        endpoint_name = re.sub(r"\bId\b", "ID", endpoint_name)
+        endpoint_name = _IDWORD_RE.sub("ID", endpoint_name)
 
         return {"path": path, "method": "GET", "name": endpoint_name}
 
@@ -77,10 +102,10 @@ def extract_endpoint_info(filename: str) -> Dict[str, str]:
     return {"path": "unknown", "method": "GET", "name": name}
 
 
-def analyze_attributes(data: Any) -> Dict[str, Set[str]]:
-    """Analyze attributes and their types from data"""
-    attr_types = defaultdict(set)
-
+def analyze_resources(
+    data: Any, attr_types: Dict[str, Set[str]], relationships: Set[str]
+) -> None:
+    """Merge attribute types and relationship names from data in one pass"""
     if isinstance(data, dict):
         if "data" in data:
             data = data["data"]
@@ -89,29 +114,48 @@ def analyze_attributes(data: Any) -> Dict[str, Set[str]]:
         items = data if isinstance(data, list) else [data]
 
         for item in items:
-            if isinstance(item, dict) and "attributes" in item:
+            if not isinstance(item, dict):
+                continue
+            if "attributes" in item:
                 for key, value in item["attributes"].items():
                     attr_types[key].add(infer_type(value))
+            if "relationships" in item:
+                relationships.update(item["relationships"].keys())
 
-    return attr_types
-
-
-def analyze_relationships(data: Any) -> Set[str]:
-    """Analyze relationships from data"""
-    relationships = set()
 
-    if isinstance(data, dict):
-        if "data" in data:
-            data = data["data"]
+def load_cache_file(cache_file: Path, full: bool) -> Dict[str, Any]:
+    """Load a cached response, streaming only its data member unless full"""
+    if full:
+        return orjson.loads(cache_file.read_bytes())
 
-        # Handle both single object and array
-        items = data if isinstance(data, list) else [data]
+    # Only "data" is analyzed, so stream just that member instead of
+    # building the full tree (e.g. "included")
+    with open(cache_file, "rb") as f:
+        return {"data": next(ijson.items(f, "data", use_float=True), None)}
 
-        for item in items:
-            if isinstance(item, dict) and "relationships" in item:
-                relationships.update(item["relationships"].keys())
 
-    return relationships
+def truncate_example(
+    value: Any, max_depth: int = 6, max_items: int = 3, max_str: int = 200
+) -> Any:
+    """Cap the nesting depth, list length and string length of an example"""
+    if isinstance(value, str):
+        return value if len(value) <= max_str else value[:max_str] + "..."
+    if isinstance(value, (dict, list)) and max_depth <= 0:
+        return "..."
+    if isinstance(value, dict):
+        return {
+            key: truncate_example(item, max_depth - 1, max_items, max_str)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        items = [
+            truncate_example(item, max_depth - 1, max_items, max_str)
+            for item in value[:max_items]
+        ]
+        if len(value) > max_items:
+            items.append(f"... {len(value) - max_items} more")
+        return items
+    return value
 
 
 def generate_documentation():
@@ -178,24 +222,26 @@ def generate_documentation():
         all_relationships = set()
         example_data = None
 
-        for cache_file, _ in files_info:
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+        # Read this endpoint's files concurrently; only the first one is
+        # loaded in full because it supplies the example response
+        with ThreadPoolExecutor(max_workers=min(32, len(files_info))) as executor:
+            futures = [
+                executor.submit(load_cache_file, cache_file, index == 0)
+                for index, (cache_file, _) in enumerate(files_info)
+            ]
+
+            for (cache_file, _), future in zip(files_info, futures):
+                try:
+                    data = future.result()
                     if example_data is None:
                         example_data = data
 
-                    # Merge attribute types
-                    attr_types = analyze_attributes(data)
-                    for key, types in attr_types.items():
-                        all_attr_types[key].update(types)
+                    # Merge attribute types and relationships
+                    analyze_resources(data, all_attr_types, all_relationships)
 
-                    # Merge relationships
-                    all_relationships.update(analyze_relationships(data))
-
-            except (json.JSONDecodeError, Exception) as e:
-                print(f"  Warning: Error processing {cache_file}: {e}")
-                continue
+                except (OSError, ValueError, ijson.JSONError) as e:
+                    print(f"  Warning: Error processing {cache_file}: {e}")
+                    continue
 
         # Document attributes
         if all_attr_types:
@@ -226,15 +272,18 @@ def generate_documentation():
             output.append("```json")
 
             # Show a simplified example (first item if array, limit depth)
+            example = example_data
             if isinstance(example_data, dict) and "data" in example_data:
                 example = {"data": example_data["data"]}
                 if isinstance(example["data"], list) and example["data"]:
                     # Show only first item for arrays
                     example["data"] = [example["data"][0]]
 
-                output.append(json.dumps(example, indent=2))
-            else:
-                output.append(json.dumps(example_data, indent=2))
+            output.append(
+                orjson.dumps(
+                    truncate_example(example), option=orjson.OPT_INDENT_2
+                ).decode()
+            )
 
             output.append("```")
             output.append("")
@@ -4,137 +4,28 @@ Generate static HTML scoreboard from cached Swimtopia API data
 Similar to wahoo-results but using Swimtopia data
 """
 
-import json
+import functools
+import os
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 from datetime import datetime
 
+import orjson
 
-def load_athletes() -> Dict[str, Dict]:
-    """Load athlete data and create ID -> athlete mapping"""
-    athletes = {}
-    cache_dir = Path("api_cache")
-
-    for athlete_file in cache_dir.glob("*athletes*.json"):
-        try:
-            with open(athlete_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            athlete_list = data.get("data", [])
-            for athlete in athlete_list:
-                athlete_id = athlete.get("id")
-                attrs = athlete.get("attributes", {})
-                athletes[athlete_id] = {
-                    "firstName": attrs.get("firstName"),
-                    "lastName": attrs.get("lastName"),
-                    "displayName": f"{attrs.get('displayFirstName', attrs.get('firstName', ''))} {attrs.get('lastName', '')}".strip(),
-                }
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Warning: Error loading {athlete_file}: {e}")
-
-    return athletes
-
-
-def format_time(time_int):
-    """Format time integer to MM:SS.ss"""
-    if not time_int:
-        return "NT"
-    minutes = time_int // 6000
-    seconds = (time_int % 6000) / 100
-    if minutes > 0:
-        return f"{minutes}:{seconds:05.2f}"
-    return f"{seconds:.2f}"
-
-
-def load_all_events() -> List[Dict]:
-    """Load all events from events list files and event-nodes files"""
-    cache_dir = Path("api_cache")
-    all_events = []
-
-    # Load events list files
-    events_list_files = list(cache_dir.glob("*events_2*.json"))
-    event_nodes_files = list(cache_dir.glob("*event-nodes*.json"))
-
-    for events_file in events_list_files:
-        # Skip event detail files (they have ID in name)
-        if "events_ID" in events_file.name:
-            continue
-
-        try:
-            with open(events_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                events_data = data.get("data", [])
-                all_events.extend(events_data)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Warning: Error loading {events_file}: {e}")
-
-    # Also load from event-nodes files (which have more complete event list)
-    for nodes_file in event_nodes_files:
-        try:
-            with open(nodes_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                nodes_data = data.get("data", [])
-
-                # Convert eventNode to event format
-                for node in nodes_data:
-                    if node.get("type") == "eventNode":
-                        # Extract event reference
-                        event_ref = node.get("relationships", {}).get("event", {}).get("data", {})
-                        if event_ref:
-                            event_id = event_ref.get("id")
-                            # Create event object from node attributes
-                            event = {
-                                "id": event_id,
-                                "type": "event",
-                                "attributes": node.get("attributes", {})
-                            }
-                            all_events.append(event)
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"Warning: Error loading {nodes_file}: {e}")
-
-    # Deduplicate by event ID (prefer non-node data if available)
-    events_by_id = {}
-    for event in all_events:
-        event_id = event.get("id")
-        # Prefer events with more complete data (from events endpoint vs nodes)
-        if event_id not in events_by_id:
-            events_by_id[event_id] = event
+from athletes import display_name
 
-    unique_events = list(events_by_id.values())
-
-    # Sort by event number
-    unique_events.sort(key=lambda e: int(e.get("attributes", {}).get("eventNumber", "999")))
-
-    return unique_events
-
-
-def load_event_details(event_id: str) -> Dict:
-    """Load detailed event data including heats and records"""
-    cache_dir = Path("api_cache")
+# Event state -> (badge label, badge CSS class) for states with fixed styling
+STATUS_BADGES = {
+    "scored": ("SCORED", "completed"),
+    "partial": ("PARTIAL", "seeded"),
+    "unseeded": ("UNSEEDED", "no-details"),
+}
 
-    # Look for event detail files
-    event_detail_files = list(cache_dir.glob(f"*events_ID_*.json"))
-
-    for detail_file in event_detail_files:
-        try:
-            with open(detail_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                event_data = data.get("data", {})
-
-                if event_data.get("id") == event_id:
-                    # Add included data
-                    event_data["included"] = data.get("included", [])
-                    return event_data
-        except (json.JSONDecodeError, Exception):
-            continue
-
-    return {}
-
-
-def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
-    """Generate HTML scoreboard from events data"""
-
-    html = """<!DOCTYPE html>
+# Static document head (including the stylesheet), shared by every run
+SCOREBOARD_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -395,7 +286,177 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
         }
     </style>
 </head>
-<body>
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_files() -> Tuple[Path, ...]:
+    """List cached JSON files with a single directory scan"""
+    cache_dir = Path("api_cache")
+    with os.scandir(cache_dir) as entries:
+        return tuple(
+            cache_dir / entry.name
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+
+def cache_files_matching(fragment: str) -> List[Path]:
+    """Return cached JSON files whose name contains fragment"""
+    return [path for path in _cache_files() if fragment in path.name]
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a single cached JSON file"""
+    return orjson.loads(path.read_bytes())
+
+
+def _read_json_files(paths: List[Path]) -> Iterator[Tuple[Path, Future]]:
+    """Read JSON files on a thread pool, yielding (path, future) in order"""
+    with ThreadPoolExecutor(max_workers=min(32, len(paths) or 1)) as executor:
+        futures = [(path, executor.submit(_read_json, path)) for path in paths]
+        yield from futures
+
+
+def load_athletes() -> Dict[str, str]:
+    """Load athlete data and create ID -> display name mapping"""
+    athletes = {}
+
+    athlete_files = cache_files_matching("athletes")
+    for athlete_file, future in _read_json_files(athlete_files):
+        try:
+            data = future.result()
+
+            athlete_list = data.get("data", [])
+            for athlete in athlete_list:
+                athlete_id = athlete.get("id")
+                attrs = athlete.get("attributes", {})
+                athletes[athlete_id] = display_name(attrs)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error loading {athlete_file}: {e}")
+
+    return athletes
+
+
+def format_time(time_int):
+    """Format time integer to MM:SS.ss"""
+    if not time_int:
+        return "NT"
+    return _format_time_cached(time_int)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_cached(time_int: int) -> str:
+    """Format a non-zero time integer; seed and result times repeat a lot"""
+    minutes = time_int // 6000
+    seconds = (time_int % 6000) / 100
+    if minutes > 0:
+        return f"{minutes}:{seconds:05.2f}"
+    return f"{seconds:.2f}"
+
+
+def event_number(event: Dict) -> int:
+    """Return an event's number for sorting, 999 if missing or not numeric"""
+    try:
+        return int(event.get("attributes", {}).get("eventNumber", "999"))
+    except (TypeError, ValueError):
+        return 999
+
+
+def load_all_events() -> List[Dict]:
+    """Load all events from events list files and event-nodes files"""
+    # Deduplicate by event ID as events are read; events list files are read
+    # first so their more complete data wins over event-nodes data
+    events_by_id = {}
+
+    # Load events list files
+    events_list_files = cache_files_matching("events_2")
+    event_nodes_files = cache_files_matching("event-nodes")
+
+    # Skip event detail files (they have ID in name)
+    events_list_files = [f for f in events_list_files if "events_ID" not in f.name]
+
+    for events_file, future in _read_json_files(events_list_files):
+        try:
+            data = future.result()
+            events_data = data.get("data", [])
+            for event in events_data:
+                events_by_id.setdefault(event.get("id"), event)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error loading {events_file}: {e}")
+
+    # Also load from event-nodes files (which have more complete event list)
+    for nodes_file, future in _read_json_files(event_nodes_files):
+        try:
+            data = future.result()
+            nodes_data = data.get("data", [])
+
+            # Convert eventNode to event format
+            for node in nodes_data:
+                if node.get("type") == "eventNode":
+                    # Extract event reference
+                    event_ref = node.get("relationships", {}).get("event", {}).get("data", {})
+                    if event_ref:
+                        event_id = event_ref.get("id")
+                        if event_id in events_by_id:
+                            continue
+                        # Create event object from node attributes
+                        events_by_id[event_id] = {
+                            "id": event_id,
+                            "type": "event",
+                            "attributes": node.get("attributes", {})
+                        }
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error loading {nodes_file}: {e}")
+
+    unique_events = list(events_by_id.values())
+
+    # Sort by event number
+    unique_events.sort(key=event_number)
+
+    return unique_events
+
+
+def load_event_details() -> Dict[str, Dict]:
+    """Load detailed event data keyed by event ID, with included items indexed"""
+    details_by_id = {}
+
+    # Parse each event detail file once instead of rescanning per event
+    detail_files = cache_files_matching("events_ID_")
+    for detail_file, future in _read_json_files(detail_files):
+        try:
+            data = future.result()
+            event_data = data.get("data", {})
+            event_id = event_data.get("id")
+            if event_id in details_by_id:
+                continue
+
+            # Build lookup maps in a single pass, bucketed by item type
+            items_by_type = defaultdict(dict)
+            for item in data.get("included", []):
+                items_by_type[item.get("type")][item.get("id")] = item
+
+            details_by_id[event_id] = {
+                "data": event_data,
+                "event_records": items_by_type["eventRecord"],
+                "relay_positions": items_by_type["relayPositionRecord"],
+                "splits_data": items_by_type["split"],
+            }
+        except (OSError, ValueError) as e:
+            print(f"Warning: Error loading {detail_file}: {e}")
+
+    return details_by_id
+
+
+def iter_scoreboard_html(
+    all_events: List[Dict],
+    athletes: Dict[str, str],
+    event_details_by_id: Dict[str, Dict],
+) -> Iterator[str]:
+    """Generate HTML scoreboard from events data, yielding it in chunks"""
+
+    yield SCOREBOARD_HEAD
+    yield """<body>
     <div class="scoreboard">
         <div class="header">
             <h1>SWIM MEET SCOREBOARD</h1>
@@ -411,30 +472,20 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
         event_type = event_attrs.get("eventType", "individual")
         state = event_attrs.get("state", "seeded")
 
-        # Try to load detailed event data
-        event_details = load_event_details(event_id)
+        # Look up detailed event data
+        event_details = event_details_by_id.get(event_id, {})
         has_details = bool(event_details)
 
         # Determine status badge
-        if state == "scored":
-            status_text = "SCORED (No Details)" if not has_details else "SCORED"
-            status_class = "completed"
-        elif state == "partial":
-            status_text = "PARTIAL (No Details)" if not has_details else "PARTIAL"
-            status_class = "seeded"
-        elif state == "unseeded":
-            status_text = "UNSEEDED (No Details)" if not has_details else "UNSEEDED"
-            status_class = "no-details"
-        elif has_details:
-            status_text = state.upper()
-            status_class = "seeded"
-        else:
-            status_text = f"{state.upper()} (No Details)"
-            status_class = "no-details"
+        default_class = "seeded" if has_details else "no-details"
+        status_label, status_class = STATUS_BADGES.get(
+            state, (state.upper(), default_class)
+        )
+        status_text = status_label if has_details else f"{status_label} (No Details)"
 
         container_class = "no-details" if not has_details else ""
 
-        html += f"""
+        yield f"""
         <div class="event-container {container_class}">
             <div class="event-header">
                 <h2>Event #{event_num}</h2>
@@ -446,31 +497,14 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
 """
 
         if not has_details:
-            html += """
+            yield """
             <div class="no-details-message">Heat and lane details not available in cache</div>
 """
         else:
-            # Process heats from detailed data
-            included = event_details.get("included", [])
-
-            # Build lookup maps
-            heats = {}
-            event_records = {}
-            relay_positions = {}
-            splits_data = {}
-
-            for item in included:
-                item_type = item.get("type")
-                item_id = item.get("id")
-
-                if item_type == "heat":
-                    heats[item_id] = item.get("attributes", {})
-                elif item_type == "eventRecord":
-                    event_records[item_id] = item
-                elif item_type == "relayPositionRecord":
-                    relay_positions[item_id] = item
-                elif item_type == "split":
-                    splits_data[item_id] = item
+            # Lookup maps were built once when the details were loaded
+            event_records = event_details["event_records"]
+            relay_positions = event_details["relay_positions"]
+            splits_data = event_details["splits_data"]
 
             # Group records by heat
             records_by_heat = {}
@@ -487,7 +521,7 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
                     key=lambda r: r.get("attributes", {}).get("laneNumber", 0)
                 )
 
-                html += f"""
+                yield f"""
             <div class="heat-header">HEAT {heat_num}</div>
             <div class="lane-results">
 """
@@ -538,19 +572,24 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
                         relay_team_name = attrs.get("relayTeamName", f"{team}")
                         relay_pos_data = record.get("relationships", {}).get("relayPositionRecords", {}).get("data", [])
 
-                        swimmers_html = []
-                        for relay_pos_ref in sorted(relay_pos_data, key=lambda x: relay_positions.get(x.get("id"), {}).get("attributes", {}).get("relayPosition", 99)):
-                            pos_id = relay_pos_ref.get("id")
-                            if pos_id in relay_positions:
-                                pos_record = relay_positions[pos_id]
+                        # Resolve each leg once, then order by relay position
+                        relay_legs = []
+                        for relay_pos_ref in relay_pos_data:
+                            pos_record = relay_positions.get(relay_pos_ref.get("id"))
+                            if pos_record:
                                 pos_num = pos_record.get("attributes", {}).get("relayPosition")
-                                athlete_ref = pos_record.get("relationships", {}).get("athlete", {}).get("data")
+                                sort_key = 99 if pos_num is None else pos_num
+                                relay_legs.append((sort_key, pos_num, pos_record))
+                        relay_legs.sort(key=itemgetter(0))
+
+                        swimmers_html = []
+                        for _, pos_num, pos_record in relay_legs:
+                            athlete_ref = pos_record.get("relationships", {}).get("athlete", {}).get("data")
 
-                                if athlete_ref:
-                                    athlete_id = athlete_ref.get("id")
-                                    athlete_info = athletes.get(athlete_id, {})
-                                    athlete_name = athlete_info.get("displayName", "Unknown")
-                                    swimmers_html.append(f'<span class="relay-swimmer">{pos_num}. {athlete_name}</span>')
+                            if athlete_ref:
+                                athlete_id = athlete_ref.get("id")
+                                athlete_name = athletes.get(athlete_id, "Unknown")
+                                swimmers_html.append(f'<span class="relay-swimmer">{pos_num}. {athlete_name}</span>')
 
                         swimmers_str = "\n".join(swimmers_html) if swimmers_html else "No swimmers"
                         athlete_display = f'<div class="team-name">{relay_team_name}</div><div class="relay-swimmers">{swimmers_str}</div>'
@@ -558,15 +597,14 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
                         athlete_ref = record.get("relationships", {}).get("athlete", {}).get("data")
                         if athlete_ref:
                             athlete_id = athlete_ref.get("id")
-                            athlete_info = athletes.get(athlete_id, {})
-                            athlete_name = athlete_info.get("displayName", "Unknown")
+                            athlete_name = athletes.get(athlete_id, "Unknown")
                         else:
                             athlete_name = "No athlete"
                         athlete_display = f'<div class="team-name">{team}</div><div>{athlete_name}</div>{split_times_html}'
 
                     result_class = "nt" if result_time == "NT" else ""
 
-                    html += f"""
+                    yield f"""
                 <div class="lane {place_class}">
                     <div class="lane-number">{lane}</div>
                     <div class="athlete-names">{athlete_display}</div>
@@ -577,22 +615,20 @@ def generate_scoreboard_html(all_events: List[Dict], athletes: Dict) -> str:
                 </div>
 """
 
-                html += """
+                yield """
             </div>
 """
 
-        html += """
+        yield """
         </div>
 """
 
-    html += """
+    yield """
     </div>
 </body>
 </html>
 """
 
-    return html
-
 
 def main():
     """Main entry point"""
@@ -613,14 +649,16 @@ def main():
     all_events = load_all_events()
     print(f"  Found {len(all_events)} events")
 
-    # Generate HTML
-    print("\nGenerating scoreboard HTML...")
-    html = generate_scoreboard_html(all_events, athletes)
+    # Load event details
+    print("\nLoading event details...")
+    event_details_by_id = load_event_details()
+    print(f"  Loaded details for {len(event_details_by_id)} events")
 
-    # Write to file
+    # Generate HTML, streaming it to the file as it is produced
+    print("\nGenerating scoreboard HTML...")
     output_file = Path("scoreboard.html")
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(iter_scoreboard_html(all_events, athletes, event_details_by_id))
 
     print(f"\n✅ Scoreboard generated: {output_file.absolute()}")
     print("\n   Open scoreboard.html in your browser to view!")
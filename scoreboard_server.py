@@ -5,13 +5,24 @@ Displays heat sheets and results with auto-refresh
 """
 
 import argparse
-import json
+import fnmatch
+import functools
+import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from flask import Flask, render_template_string
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import ijson
+import orjson
+from flask import Flask
+from jinja2 import Template
+from waitress import serve
+from athletes import Athletes
 from swimtopia_export import SwimtopiaExporter, load_config
 
 
@@ -22,38 +33,182 @@ MODE = "cache"
 MEET_ID = None
 API_CLIENT = None
 
+TEMPLATE_PATH = Path("scoreboard_template.html")
+CACHE_DIR = Path("api_cache")
+
+# Filename patterns selecting each group of cached API responses
+CACHE_FILE_PATTERNS = {
+    "all": "*.json",
+    "athletes": "*athletes*.json",
+    "events_list": "*events_2*.json",
+    "event_nodes": "*event-nodes*.json",
+    "event_details": "*events_ID_*.json",
+    "meets": "*meets_ID_2*.json",
+}
+_CACHE_FILE_MATCHERS = {
+    group: re.compile(fnmatch.translate(pattern)).match
+    for group, pattern in CACHE_FILE_PATTERNS.items()
+}
+
+# How long loaded data is reused between page requests
+CACHE_TTL_SECONDS = 2.0
+LIVE_TTL_SECONDS = 5.0
+
+
+def ttl_cache(ttl_seconds: float, version: Optional[Callable[[], Any]] = None):
+    """
+    Memoize a function's results per argument tuple for ttl_seconds
+
+    If a version function is given, an expired entry is only recomputed when
+    the version has changed since the entry was stored.
+    """
+
+    def decorator(func):
+        entries = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            entry = entries.get(args)
+            if entry and time.monotonic() < entry[0]:
+                return entry[2]
+
+            # Only one thread refreshes an entry; the rest wait and reuse it
+            with lock:
+                now = time.monotonic()
+                entry = entries.get(args)
+                if entry and now < entry[0]:
+                    return entry[2]
+
+                current_version = version() if version else None
+                if entry and version and entry[1] == current_version:
+                    value = entry[2]
+                else:
+                    value = func(*args)
+                entries[args] = (now + ttl_seconds, current_version, value)
+                return value
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+# pylint: disable-next=unused-argument  # dir_mtime_ns only keys the lru_cache
+def _scan_cache(dir_mtime_ns: int) -> Dict[str, List[Path]]:
+    """Group the cache directory's files by pattern in a single scandir pass"""
+    groups = {group: [] for group in CACHE_FILE_PATTERNS}
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            path = Path(entry.path)
+            for group, matches in _CACHE_FILE_MATCHERS.items():
+                if matches(entry.name):
+                    groups[group].append(path)
+    return groups
+
+
+def cache_files(group: str) -> List[Path]:
+    """
+    Cached files in one of the CACHE_FILE_PATTERNS groups
+
+    The directory is only rescanned when its mtime changes, i.e. when files
+    are added, removed or renamed.
+    """
+    try:
+        dir_mtime_ns = CACHE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    return _scan_cache(dir_mtime_ns)[group]
+
+
+@ttl_cache(CACHE_TTL_SECONDS)
+def cache_version() -> Tuple[int, int]:
+    """
+    Cache directory mtime and latest modification time of any cached JSON file
+
+    The directory mtime changes when a file is deleted, which the newest file
+    mtime alone would miss.
+    """
+    try:
+        dir_mtime_ns = CACHE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime_ns = 0
+    newest_mtime_ns = max(
+        (path.stat().st_mtime_ns for path in cache_files("all")),
+        default=0,
+    )
+    return (dir_mtime_ns, newest_mtime_ns)
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    """Read one cache file, returning None if it can't be read"""
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        print(f"Warning: Error reading {path}: {e}")
+        return None
+
+
+def _bulk_read(paths: List[Path]) -> List[Tuple[Path, bytes]]:
+    """Read a batch of cache files concurrently, skipping unreadable ones"""
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        contents = list(executor.map(_read_bytes, paths))
+
+    return [
+        (path, content) for path, content in zip(paths, contents) if content is not None
+    ]
+
+
+@functools.lru_cache(maxsize=256)
+# pylint: disable-next=unused-argument  # mtime_ns and size only key the lru_cache
+def _parse_athletes_file(path_str: str, mtime_ns: int, size: int) -> List[Dict]:
+    """
+    Parse the athlete list from one cache file
 
-def load_athletes_from_cache() -> Dict[str, Dict]:
+    The file's mtime and size are part of the cache key, so an edited file is
+    parsed again while unchanged files are never re-read.
+    """
+    return orjson.loads(Path(path_str).read_bytes()).get("data", [])
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a whole cache file"""
+    return orjson.loads(path.read_bytes())
+
+
+def _load_data_items(path: Path) -> List[Dict]:
+    """Stream only data[*] out of a cache file"""
+    with open(path, "rb") as f:
+        return list(ijson.items(f, "data.item", use_float=True))
+
+
+@ttl_cache(CACHE_TTL_SECONDS, version=cache_version)
+def load_athletes_from_cache() -> Athletes:
     """Load athlete data from cache"""
-    athletes = {}
-    cache_dir = Path("api_cache")
+    athletes = Athletes()
 
-    for athlete_file in cache_dir.glob("*athletes*.json"):
+    for athlete_file in cache_files("athletes"):
         try:
-            with open(athlete_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            athlete_list = data.get("data", [])
-            for athlete in athlete_list:
-                athlete_id = athlete.get("id")
-                attrs = athlete.get("attributes", {})
-                athletes[athlete_id] = {
-                    "firstName": attrs.get("firstName"),
-                    "lastName": attrs.get("lastName"),
-                    "displayName": f"{attrs.get('displayFirstName', attrs.get('firstName', ''))} {attrs.get('lastName', '')}".strip(),
-                }
-        except (json.JSONDecodeError, Exception) as e:
+            stat = athlete_file.stat()
+            athletes.extend(
+                _parse_athletes_file(str(athlete_file), stat.st_mtime_ns, stat.st_size)
+            )
+        except (OSError, ValueError) as e:
             print(f"Warning: Error loading {athlete_file}: {e}")
 
     return athletes
 
 
-def load_athletes_from_api(meet_id: str) -> Dict[str, Dict]:
+@ttl_cache(LIVE_TTL_SECONDS)
+def load_athletes_from_api(meet_id: str) -> Athletes:
     """Load athlete data from live API"""
     if not API_CLIENT:
         raise Exception("API client not initialized")
 
-    athletes = {}
+    athletes = Athletes()
     url = f"{API_CLIENT.base_url}/v3/meets/{meet_id}/athletes"
 
     try:
@@ -61,16 +216,7 @@ def load_athletes_from_api(meet_id: str) -> Dict[str, Dict]:
         response.raise_for_status()
 
         data = response.json()
-        athlete_list = data.get("data", [])
-
-        for athlete in athlete_list:
-            athlete_id = athlete.get("id")
-            attrs = athlete.get("attributes", {})
-            athletes[athlete_id] = {
-                "firstName": attrs.get("firstName"),
-                "lastName": attrs.get("lastName"),
-                "displayName": f"{attrs.get('displayFirstName', attrs.get('firstName', ''))} {attrs.get('lastName', '')}".strip(),
-            }
+        athletes.extend(data.get("data", []))
 
     except Exception as e:
         print(f"Error fetching athletes from API: {e}")
@@ -79,62 +225,74 @@ def load_athletes_from_api(meet_id: str) -> Dict[str, Dict]:
     return athletes
 
 
-def load_all_events_from_cache() -> List[Dict]:
+class Event(NamedTuple):
+    """An event as the scoreboard needs it: its ID and attributes"""
+
+    id: Optional[str]
+    attributes: Dict[str, Any]
+
+
+def event_number(event: Event) -> int:
+    """Return an event's number for sorting, 999 if missing or not numeric"""
+    try:
+        return int(event.attributes.get("eventNumber", "999"))
+    except (TypeError, ValueError):
+        return 999
+
+
+@ttl_cache(CACHE_TTL_SECONDS, version=cache_version)
+def load_all_events_from_cache() -> List[Event]:
     """Load all events from cache"""
-    cache_dir = Path("api_cache")
-    all_events = []
+    # Deduplicate by event ID as events are read; events list files are read
+    # first so their data wins over event-nodes data
+    seen = set()
+    unique_events = []
 
     # Load events list files
-    events_list_files = list(cache_dir.glob("*events_2*.json"))
-    event_nodes_files = list(cache_dir.glob("*event-nodes*.json"))
+    events_list_files = [
+        f for f in cache_files("events_list") if "events_ID" not in f.name
+    ]
+    event_nodes_files = cache_files("event_nodes")
 
-    for events_file in events_list_files:
-        if "events_ID" in events_file.name:
-            continue
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list_loads = [executor.submit(_load_data_items, f) for f in events_list_files]
+        node_loads = [executor.submit(_load_data_items, f) for f in event_nodes_files]
 
+    for events_file, load in zip(events_list_files, list_loads):
         try:
-            with open(events_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                events_data = data.get("data", [])
-                all_events.extend(events_data)
-        except (json.JSONDecodeError, Exception) as e:
+            events_data = load.result()
+            for event in events_data:
+                event_id = event.get("id")
+                if event_id not in seen:
+                    seen.add(event_id)
+                    unique_events.append(Event(event_id, event.get("attributes", {})))
+        except (OSError, ValueError, ijson.JSONError) as e:
             print(f"Warning: Error loading {events_file}: {e}")
 
     # Also load from event-nodes files
-    for nodes_file in event_nodes_files:
+    for nodes_file, load in zip(event_nodes_files, node_loads):
         try:
-            with open(nodes_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                nodes_data = data.get("data", [])
-
-                for node in nodes_data:
-                    if node.get("type") == "eventNode":
-                        event_ref = node.get("relationships", {}).get("event", {}).get("data", {})
-                        if event_ref:
-                            event_id = event_ref.get("id")
-                            event = {
-                                "id": event_id,
-                                "type": "event",
-                                "attributes": node.get("attributes", {})
-                            }
-                            all_events.append(event)
-        except (json.JSONDecodeError, Exception) as e:
+            nodes_data = load.result()
+
+            for node in nodes_data:
+                if node.get("type") == "eventNode":
+                    event_ref = node.get("relationships", {}).get("event", {}).get("data", {})
+                    if event_ref:
+                        event_id = event_ref.get("id")
+                        if event_id in seen:
+                            continue
+                        seen.add(event_id)
+                        unique_events.append(Event(event_id, node.get("attributes", {})))
+        except (OSError, ValueError, ijson.JSONError) as e:
             print(f"Warning: Error loading {nodes_file}: {e}")
 
-    # Deduplicate by event ID
-    events_by_id = {}
-    for event in all_events:
-        event_id = event.get("id")
-        if event_id not in events_by_id:
-            events_by_id[event_id] = event
-
-    unique_events = list(events_by_id.values())
-    unique_events.sort(key=lambda e: int(e.get("attributes", {}).get("eventNumber", "999")))
+    unique_events.sort(key=event_number)
 
     return unique_events
 
 
-def load_all_events_from_api(meet_id: str) -> List[Dict]:
+@ttl_cache(LIVE_TTL_SECONDS)
+def load_all_events_from_api(meet_id: str) -> List[Event]:
     """Load all events from live API"""
     if not API_CLIENT:
         raise Exception("API client not initialized")
@@ -153,15 +311,9 @@ def load_all_events_from_api(meet_id: str) -> List[Dict]:
             if node.get("type") == "eventNode":
                 event_ref = node.get("relationships", {}).get("event", {}).get("data", {})
                 if event_ref:
-                    event_id = event_ref.get("id")
-                    event = {
-                        "id": event_id,
-                        "type": "event",
-                        "attributes": node.get("attributes", {})
-                    }
-                    all_events.append(event)
-
-        all_events.sort(key=lambda e: int(e.get("attributes", {}).get("eventNumber", "999")))
+                    all_events.append(Event(event_ref.get("id"), node.get("attributes", {})))
+
+        all_events.sort(key=event_number)
         return all_events
 
     except Exception as e:
@@ -169,26 +321,43 @@ def load_all_events_from_api(meet_id: str) -> List[Dict]:
         raise
 
 
-def load_event_details_from_cache(event_id: str) -> Dict:
-    """Load detailed event data from cache"""
-    cache_dir = Path("api_cache")
-    event_detail_files = list(cache_dir.glob(f"*events_ID_*.json"))
+@ttl_cache(CACHE_TTL_SECONDS, version=cache_version)
+def event_file_index() -> Dict[str, Path]:
+    """Map event IDs to their cached event detail files"""
+    index = {}
 
-    for detail_file in event_detail_files:
+    for detail_file in cache_files("event_details"):
         try:
-            with open(detail_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                event_data = data.get("data", {})
-
-                if event_data.get("id") == event_id:
-                    event_data["included"] = data.get("included", [])
-                    return event_data
-        except (json.JSONDecodeError, Exception):
+            # Only data.id is needed, so stop parsing as soon as it is seen
+            with open(detail_file, "rb") as f:
+                event_id = next(ijson.items(f, "data.id"), None)
+        except (OSError, ijson.JSONError):
             continue
 
-    return {}
+        if event_id is not None:
+            index.setdefault(event_id, detail_file)
 
+    return index
 
+
+@ttl_cache(CACHE_TTL_SECONDS, version=cache_version)
+def load_event_details_from_cache(event_id: str) -> Dict:
+    """Load detailed event data from cache"""
+    detail_file = event_file_index().get(event_id)
+    if not detail_file:
+        return {}
+
+    try:
+        data = _load_json(detail_file)
+    except (OSError, ValueError):
+        return {}
+
+    event_data = data.get("data", {})
+    event_data["included"] = data.get("included", [])
+    return event_data
+
+
+@ttl_cache(LIVE_TTL_SECONDS)
 def load_event_details_from_api(meet_id: str, event_id: str) -> Dict:
     """Load detailed event data from live API"""
     if not API_CLIENT:
@@ -212,32 +381,32 @@ def load_event_details_from_api(meet_id: str, event_id: str) -> Dict:
         return {}
 
 
+@ttl_cache(CACHE_TTL_SECONDS, version=cache_version)
 def load_meet_info_from_cache() -> Dict:
     """Load meet information from cache"""
-    cache_dir = Path("api_cache")
-
     # Try to load from meet detail files
-    meet_files = list(cache_dir.glob("*meets_ID_2*.json"))
-
-    for meet_file in meet_files:
-        if "events" in meet_file.name or "athletes" in meet_file.name:
-            continue
+    meet_files = [
+        f
+        for f in cache_files("meets")
+        if "events" not in f.name and "athletes" not in f.name
+    ]
 
+    for _, content in _bulk_read(meet_files):
         try:
-            with open(meet_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(content)
 
             # Check if this is a meet detail response (single meet)
             meet_data = data.get("data", {})
             if isinstance(meet_data, dict) and meet_data.get("type") == "meet":
                 return meet_data.get("attributes", {})
 
-        except (json.JSONDecodeError, Exception):
+        except ValueError:
             continue
 
     return {}
 
 
+@ttl_cache(LIVE_TTL_SECONDS)
 def load_meet_info_from_api(meet_id: str) -> Dict:
     """Load meet information from live API"""
     if not API_CLIENT:
@@ -258,8 +427,9 @@ def load_meet_info_from_api(meet_id: str) -> Dict:
         return {}
 
 
+@functools.lru_cache(maxsize=4096)
 def format_time(time_int):
-    """Format time integer to MM:SS.ss"""
+    """Format time integer to MM:SS.ss; memoized as seed times repeat a lot"""
     if not time_int:
         return "NT"
     minutes = time_int // 6000
@@ -283,9 +453,16 @@ def generate_scoreboard_data():
         if not MEET_ID:
             raise Exception("MEET_ID not set for live mode")
 
-        athletes = load_athletes_from_api(MEET_ID)
-        all_events = load_all_events_from_api(MEET_ID)
-        meet_info = load_meet_info_from_api(MEET_ID)
+        # The three top-level requests are independent, so issue them
+        # concurrently over the client's pooled session
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            athletes_request = executor.submit(load_athletes_from_api, MEET_ID)
+            events_request = executor.submit(load_all_events_from_api, MEET_ID)
+            meet_info_request = executor.submit(load_meet_info_from_api, MEET_ID)
+
+        athletes = athletes_request.result()
+        all_events = events_request.result()
+        meet_info = meet_info_request.result()
 
         def get_event_details(event_id):
             return load_event_details_from_api(MEET_ID, event_id)
@@ -300,6 +477,22 @@ def generate_scoreboard_data():
     }
 
 
+@functools.lru_cache(maxsize=1)
+# pylint: disable-next=unused-argument  # mtime_ns only keys the lru_cache
+def _compile_template(mtime_ns: int) -> Template:
+    """Parse the scoreboard template; keyed on mtime so edits are picked up"""
+    return app.jinja_env.from_string(TEMPLATE_PATH.read_text(encoding="utf-8"))
+
+
+def get_template() -> Optional[Template]:
+    """Return the compiled scoreboard template, or None if it is missing"""
+    try:
+        mtime_ns = TEMPLATE_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _compile_template(mtime_ns)
+
+
 @app.route("/")
 def scoreboard():
     """Render the scoreboard"""
@@ -308,16 +501,11 @@ def scoreboard():
     except Exception as e:
         return f"<h1>Error Loading Scoreboard</h1><p>{str(e)}</p>", 500
 
-    # Read the HTML template
-    template_path = Path("scoreboard_template.html")
-    if template_path.exists():
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-    else:
+    template = get_template()
+    if template is None:
         return "<h1>Error</h1><p>scoreboard_template.html not found</p>", 500
 
-    return render_template_string(
-        template,
+    return template.render(
         data=data,
         format_time=format_time,
         enumerate=enumerate,
@@ -362,6 +550,17 @@ def main():
         default="127.0.0.1",
         help="Host to bind to (default: 127.0.0.1, use 0.0.0.0 for network access)"
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=8,
+        help="Worker threads for serving requests (default: 8)"
+    )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use the Flask development server with debugging and auto-reload"
+    )
 
     args = parser.parse_args()
 
@@ -405,19 +604,21 @@ def main():
         print(f"\n=== Starting Scoreboard Server (CACHE MODE) ===\n")
 
         # Check cache exists
-        cache_dir = Path("api_cache")
-        if not cache_dir.exists():
+        if not CACHE_DIR.exists():
             print("❌ api_cache/ directory not found")
             sys.exit(1)
 
-        cache_files = list(cache_dir.glob("*.json"))
-        print(f"Found {len(cache_files)} cached files\n")
+        print(f"Found {len(cache_files('all'))} cached files\n")
 
     print(f"Server starting on http://{args.host}:{args.port}")
     print(f"Mode: {MODE.upper()}")
     print(f"\nPress Ctrl+C to stop\n")
 
-    app.run(host=args.host, port=args.port, debug=True)
+    if args.dev:
+        app.run(host=args.host, port=args.port, debug=True)
+    else:
+        # Serve concurrent auto-refreshes from multiple displays in parallel
+        serve(app, host=args.host, port=args.port, threads=args.threads)
 
 
 if __name__ == "__main__":
@@ -3,31 +3,63 @@
 Display heat, lane, and athlete assignments from cached API data
 """
 
-import json
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Tuple
 
+import orjson
 
-def load_athletes() -> Dict[str, Dict]:
-    """Load athlete data and create ID -> athlete mapping"""
-    athletes = {}
+from athletes import Athletes
+
+
+# Heat table layout: lane, team, athlete(s), seed time
+ROW_FORMAT = "  {:<6} {:<15} {:<50} {:<12}"
+HEAT_HEADER = ROW_FORMAT.format("Lane", "Team", "Athlete(s)", "Seed Time") + f"\n  {'-'*90}"
+
+
+def _load_json(path: Path) -> Any:
+    """Read and parse a cached JSON file"""
+    return orjson.loads(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_seed(seed_time):
+    """Format a seed time integer to MM:SS.ss, or NT if there is none"""
+    if not seed_time:
+        return "NT"
+    minutes = seed_time // 6000
+    seconds = (seed_time % 6000) / 100
+    return f"{minutes}:{seconds:05.2f}" if minutes > 0 else f"{seconds:.2f}"
+
+
+def _heat_number(record: Dict) -> Any:
+    """Heat number of an event record"""
+    return record.get("attributes", {}).get("heatNumber")
+
+
+def _heat_and_lane(record: Dict) -> Tuple[Any, ...]:
+    """Sort key placing event records in heat, then lane order"""
+    # Unseeded entries have a null heat or lane; they sort after the rest
+    heat = _heat_number(record)
+    lane = record.get("attributes", {}).get("laneNumber", 0)
+    return heat is None, heat or 0, lane is None, lane or 0
+
+
+def load_athletes() -> Athletes:
+    """Load athlete data and create ID -> athlete lookup"""
+    athletes = Athletes()
     cache_dir = Path("api_cache")
 
     for athlete_file in cache_dir.glob("*athletes*.json"):
         try:
-            with open(athlete_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            athlete_list = data.get("data", [])
-            for athlete in athlete_list:
-                athlete_id = athlete.get("id")
-                attrs = athlete.get("attributes", {})
-                athletes[athlete_id] = {
-                    "firstName": attrs.get("firstName"),
-                    "lastName": attrs.get("lastName"),
-                    "displayName": f"{attrs.get('displayFirstName', attrs.get('firstName', ''))} {attrs.get('lastName', '')}".strip(),
-                }
-        except (json.JSONDecodeError, Exception) as e:
+            data = _load_json(athlete_file)
+
+            athletes.extend(data.get("data", []))
+        except (OSError, ValueError) as e:
             print(f"Warning: Error loading {athlete_file}: {e}")
 
     return athletes
@@ -49,11 +81,23 @@ def show_event_details():
         print("No event detail files found in cache")
         return
 
-    for event_file in sorted(event_files):
+    # Read and parse all event files concurrently, then report them in order
+    event_files = sorted(event_files)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        loads = [executor.submit(_load_json, event_file) for event_file in event_files]
+
+    # Collect each event's report and write it out in one go instead of
+    # per line, so an error later on can't discard events already built
+    lines = []
+    for event_file, load in zip(event_files, loads):
         try:
-            with open(event_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load.result()
+        except (OSError, ValueError) as e:
+            lines.append(f"\nError processing {event_file}: {e}")
+            continue
 
+        # Unexpected data in one event is reported and the rest still print
+        try:
             event_data = data.get("data", {})
             event_attrs = event_data.get("attributes", {})
             included = data.get("included", [])
@@ -63,9 +107,9 @@ def show_event_details():
             event_label = event_attrs.get("label", "Unknown Event")
             event_type = event_attrs.get("eventType", "individual")
 
-            print(f"\n{'─'*100}")
-            print(f"EVENT #{event_num}: {event_label} ({event_type.upper()})")
-            print(f"{'─'*100}")
+            lines.append(f"\n{'─'*100}")
+            lines.append(f"EVENT #{event_num}: {event_label} ({event_type.upper()})")
+            lines.append(f"{'─'*100}")
 
             # Build lookup maps
             heats = {}
@@ -83,38 +127,34 @@ def show_event_details():
                 elif item_type == "relayPositionRecord":
                     relay_positions[item_id] = item
 
-            # Group records by heat
-            records_by_heat = {}
-            for record_id, record in event_records.items():
-                heat_number = record.get("attributes", {}).get("heatNumber")
-                if heat_number not in records_by_heat:
-                    records_by_heat[heat_number] = []
-                records_by_heat[heat_number].append(record)
-
-            # Display each heat
-            for heat_num in sorted(records_by_heat.keys()):
-                records = sorted(
-                    records_by_heat[heat_num],
-                    key=lambda r: r.get("attributes", {}).get("laneNumber", 0)
-                )
-
-                print(f"\n  Heat {heat_num}:")
-                print(f"  {'Lane':<6} {'Team':<15} {'Athlete(s)':<50} {'Seed Time':<12}")
-                print(f"  {'-'*90}")
+            # Resolve each relay position to its "position:athlete" label once,
+            # rather than chasing the same references for every record
+            relay_resolved = {}
+            for pos_id, pos_record in relay_positions.items():
+                athlete_ref = pos_record.get("relationships", {}).get("athlete", {}).get("data")
+                if athlete_ref:
+                    pos_num = pos_record.get("attributes", {}).get("relayPosition")
+                    athlete_id = athlete_ref.get("id")
+                    athlete_name = athletes.display(athlete_id, f"Athlete {athlete_id[:8]}")
+                    relay_resolved[pos_id] = f"{pos_num}:{athlete_name}"
+
+            # Order records by heat then lane in one sort and walk each heat
+            ordered_records = sorted(event_records.values(), key=_heat_and_lane)
+            for heat_num, heat_records in groupby(ordered_records, key=_heat_number):
+                records = list(heat_records)
+
+                lines.append(f"\n  Heat {heat_num}:")
+                lines.append(HEAT_HEADER)
 
                 for record in records:
                     attrs = record.get("attributes", {})
-                    lane = attrs.get("laneNumber", "?")
+                    lane = attrs.get("laneNumber")
+                    if lane is None:
+                        lane = "?"
                     team = attrs.get("teamAbbreviation", "?")
                     seed_time = attrs.get("seedTimeInt")
 
-                    # Format seed time
-                    if seed_time:
-                        minutes = seed_time // 6000
-                        seconds = (seed_time % 6000) / 100
-                        time_str = f"{minutes}:{seconds:05.2f}" if minutes > 0 else f"{seconds:.2f}"
-                    else:
-                        time_str = "NT"
+                    time_str = _fmt_seed(seed_time)
 
                     # Get athlete(s)
                     if event_type == "relay":
@@ -125,22 +165,14 @@ def show_event_details():
                         # Get relay position records
                         relay_pos_data = record.get("relationships", {}).get("relayPositionRecords", {}).get("data", [])
 
-                        swimmers = []
-                        for relay_pos_ref in relay_pos_data:
-                            pos_id = relay_pos_ref.get("id")
-                            if pos_id in relay_positions:
-                                pos_record = relay_positions[pos_id]
-                                pos_num = pos_record.get("attributes", {}).get("relayPosition")
-                                athlete_ref = pos_record.get("relationships", {}).get("athlete", {}).get("data")
-
-                                if athlete_ref:
-                                    athlete_id = athlete_ref.get("id")
-                                    athlete_info = athletes.get(athlete_id, {})
-                                    athlete_name = athlete_info.get("displayName", f"Athlete {athlete_id[:8]}")
-                                    swimmers.append(f"{pos_num}:{athlete_name}")
+                        swimmers = [
+                            relay_resolved[pos_id]
+                            for pos_id in (ref.get("id") for ref in relay_pos_data)
+                            if pos_id in relay_resolved
+                        ]
 
                         swimmer_str = ", ".join(swimmers) if swimmers else "No swimmers assigned"
-                        print(f"  {lane:<6} {team_name:<15} {swimmer_str:<50} {time_str:<12}")
+                        lines.append(ROW_FORMAT.format(lane, team_name, swimmer_str, time_str))
 
                     else:  # individual
                         # Get athlete
@@ -148,18 +180,20 @@ def show_event_details():
 
                         if athlete_ref:
                             athlete_id = athlete_ref.get("id")
-                            athlete_info = athletes.get(athlete_id, {})
-                            athlete_name = athlete_info.get("displayName", f"Athlete {athlete_id[:8]}")
+                            athlete_name = athletes.display(athlete_id, f"Athlete {athlete_id[:8]}")
                         else:
                             athlete_name = "No athlete assigned"
 
-                        print(f"  {lane:<6} {team:<15} {athlete_name:<50} {time_str:<12}")
+                        lines.append(ROW_FORMAT.format(lane, team, athlete_name, time_str))
 
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"\nError processing {event_file}: {e}")
-            continue
+        except Exception as e:
+            lines.append(f"\nError processing {event_file}: {e}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
 
-    print(f"\n{'='*100}\n")
+    lines.append(f"\n{'='*100}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -3,31 +3,308 @@
 Enhanced Swimtopia API Export Script with config file support
 """
 
+import argparse
+import io
 import json
+import logging
+import os
+import random
+import shutil
+import sys
+import threading
 import time
 import uuid
-import requests
-import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, Dict, Any
-from urllib.parse import urljoin
 from pathlib import Path
-import argparse
+from typing import Optional, Dict, Any, Callable, Iterator, List, Set, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Connection pool size per host; large enough for concurrent meet exports
+POOL_SIZE = 32
+
+# Transient gateway errors, rate limiting and connection resets are retried
+# with backoff, waiting out any Retry-After the server sends.
+# POST is included because export tasks carry a client-generated ID.
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Downloads are read in 64 KiB chunks; progress is printed about once per MiB
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+PROGRESS_INTERVAL = 1024 * 1024
+
+# Without progress output the body is copied in C in 1 MiB blocks
+DOWNLOAD_COPY_SIZE = 1024 * 1024
+
+# Large files from servers that accept byte ranges are fetched in parallel parts
+PARALLEL_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+PARALLEL_DOWNLOAD_PARTS = 4
+
+# Downloaded files are written through a 1 MiB buffer and synced once at close
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
+# Per-directory record of downloaded exports, for conditional re-downloads
+DOWNLOAD_CACHE_NAME = ".export_cache.json"
+_DOWNLOAD_CACHE_LOCK = threading.Lock()
+
+# Where the CLI keeps its OAuth token between runs; a saved token is only
+# reused while it has more than TOKEN_EXPIRY_MARGIN seconds left
+TOKEN_CACHE_PATH = Path.home() / ".config" / "swimtopia" / "token.json"
+TOKEN_EXPIRY_MARGIN = 60
+
+# Status polling starts fast and backs off exponentially up to poll_interval,
+# each delay stretched by up to POLL_JITTER of itself
+POLL_INITIAL_DELAY = 0.25
+POLL_JITTER = 0.1
+
+# A status body lacking both of these can't be in a terminal state
+TERMINAL_STATE_MARKERS = (b'"completed"', b'"failed"')
+
+
+# exportTask request body; each quoted "$name" is replaced per task
+EXPORT_TASK_TEMPLATE = orjson.dumps(
+    {
+        "data": {
+            "type": "exportTask",
+            "id": "$task_id",
+            "attributes": {
+                "exportType": "$export_type",
+                "exportFormat": "$export_format",
+                "exportOptions": {
+                    "team": {"value": "$team_value", "label": "$team_label"},
+                    "session": {"value": "$session_value", "label": "$session_label"},
+                },
+            },
+            "relationships": {"meet": {"data": {"type": "meet", "id": "$meet_id"}}},
+        }
+    }
+)
+
+
+def export_task_body(**values: Any) -> bytes:
+    """Fill EXPORT_TASK_TEMPLATE, JSON-encoding each value into its placeholder"""
+    body = EXPORT_TASK_TEMPLATE
+    for name, value in values.items():
+        body = body.replace(f'"${name}"'.encode(), orjson.dumps(value))
+    return body
+
+
+def sync_data(fd: int) -> None:
+    """Flush a file's data to disk, skipping metadata where the OS allows"""
+    getattr(os, "fdatasync", os.fsync)(fd)
+
+
+@contextmanager
+def open_download(
+    output_path: Path, expected_size: int = 0
+) -> Iterator[io.BufferedWriter]:
+    """
+    Open a download target behind a DOWNLOAD_WRITE_BUFFER write buffer
+
+    With an expected_size the file's blocks are reserved up front where
+    the OS supports it; the file is cut back to what was actually written,
+    then flushed and synced to disk once, when the block exits. If the
+    block raises, the file is removed rather than left at its reserved size.
+    """
+    try:
+        with open(output_path, "wb", buffering=0) as raw:
+            if expected_size > 0 and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(raw.fileno(), 0, expected_size)
+                except OSError:
+                    pass  # Not supported by this filesystem; just grow as written
+            f = io.BufferedWriter(raw, buffer_size=DOWNLOAD_WRITE_BUFFER)
+            yield f
+            f.flush()
+            raw.truncate(f.tell())
+            sync_data(raw.fileno())
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
+
+
+def progress_printer(
+    meet_id: Optional[str], show_progress: bool
+) -> Callable[..., None]:
+    """
+    print for an interactive export; otherwise a logger call per line
+
+    Quiet exports run side by side, so their multi-line status blocks are
+    logged one record per line, tagged with the meet, instead of printed.
+    """
+    if show_progress:
+        return print
+    prefix = f"[meet {meet_id}] " if meet_id else ""
+
+    def log_lines(message: str = "", **_print_options: Any) -> None:
+        for line in message.splitlines():
+            if line.strip():
+                logger.info("%s%s", prefix, line.strip())
+
+    return log_lines
+
+
+def new_task_id() -> str:
+    """
+    Generate a client-side export task ID
+
+    The API documents these as UUIDs, so the canonical dashed form is kept
+    rather than a bare hex token the server may not accept.
+    """
+    return str(uuid.uuid4())
+
+
+def _valid_download_entry(filename: str, entry: Any) -> bool:
+    """Whether a download cache entry has the fields download_export reads"""
+    return (
+        "/" not in filename
+        and isinstance(entry, dict)
+        and isinstance(entry.get("size"), int)
+        and isinstance(entry.get("etag"), (str, type(None)))
+        and isinstance(entry.get("last_modified"), (str, type(None)))
+    )
+
+
+def filename_from_url(url: str) -> str:
+    """File name at the end of a download URL's path"""
+    return requests.utils.unquote(url.split("/")[-1].split("?")[0])
+
+
+def load_download_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the file name -> validator/size record, empty if missing or bad"""
+    try:
+        entries = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return {
+        filename: entry
+        for filename, entry in entries.items()
+        if _valid_download_entry(filename, entry)
+    }
+
+
+def remember_download(
+    cache_path: Path, response: requests.Response, output_path: Path
+) -> None:
+    """
+    Record a download's ETag/Last-Modified so it can be revalidated later
+
+    Entries are keyed by file name rather than URL, since every export
+    task gets a new signed URL for what may be the same file.
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    with _DOWNLOAD_CACHE_LOCK:
+        entries = load_download_cache(cache_path)
+        if etag or last_modified:
+            entries[output_path.name] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": output_path.stat().st_size,
+            }
+        elif entries.pop(output_path.name, None) is None:
+            return
+        cache_path.write_bytes(orjson.dumps(entries, option=orjson.OPT_INDENT_2))
+
+
+def load_saved_token(
+    token_path: Path, base_url: str, username: str
+) -> Optional[Dict[str, Any]]:
+    """Return the saved token for this API and user if it is still fresh"""
+    try:
+        saved = orjson.loads(token_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(saved, dict):
+        return None
+    if saved.get("base_url") != base_url or saved.get("username") != username:
+        return None
+    expires_at = saved.get("expires_at")
+    if not saved.get("access_token") or not isinstance(expires_at, (int, float)):
+        return None
+    if time.time() >= expires_at - TOKEN_EXPIRY_MARGIN:
+        return None
+    return saved
+
+
+def save_token(
+    token_path: Path,
+    base_url: str,
+    username: str,
+    access_token: str,
+    expires_at: float,
+) -> None:
+    """Write the token to a file only the current user can read"""
+    token_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd = os.open(token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        # The mode above only applies when the file is created
+        os.fchmod(f.fileno(), 0o600)
+        f.write(
+            orjson.dumps(
+                {
+                    "base_url": base_url,
+                    "username": username,
+                    "access_token": access_token,
+                    "expires_at": expires_at,
+                }
+            )
+        )
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Delay requested by a Retry-After header given in seconds, if any"""
+    retry_after = response.headers.get("Retry-After", "")
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        return None
 
 
 class SwimtopiaExporter:
     """Handles Swimtopia API authentication and export operations"""
 
     def __init__(
-        self, base_url: str = "https://api.swimtopia.org", verify_ssl: bool = True
+        self,
+        base_url: str = "https://api.swimtopia.org",
+        verify_ssl: bool = True,
+        token_path: Optional[Path] = None,
     ):
         self.base_url = base_url
         self.verify_ssl = verify_ssl
+        self.token_path = token_path
         self.session = requests.Session()
         self.session.verify = verify_ssl
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY_POLICY
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.access_token = None
         self.token_expires_at = None
+        self.token_username = None
+        # Kept so a token the server stops accepting can be replaced once
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._issued_tokens: Set[str] = set()
+        self._auth_lock = threading.Lock()
 
         # Set default headers
         self.session.headers.update(
@@ -35,14 +312,107 @@ class SwimtopiaExporter:
                 "Accept": "application/vnd.api+json",
                 "Content-Type": "application/vnd.api+json",
                 "User-Agent": "SwimtopiaExporter/1.0",
+                # Every encoding urllib3 can decode here; br/zstd only when
+                # the brotli/zstandard packages are installed
+                "Accept-Encoding": urllib3.util.make_headers(accept_encoding=True)[
+                    "accept-encoding"
+                ],
             }
         )
+        self._content_encoding_logged = False
+        self.session.hooks["response"].append(self._log_content_encoding)
+        self.session.hooks["response"].append(self._reauthenticate_on_401)
+
+    def _log_content_encoding(self, response: requests.Response, *_args, **_kwargs):
+        """Log once which Content-Encoding the API actually answers with"""
+        if response.ok and not self._content_encoding_logged:
+            self._content_encoding_logged = True
+            logger.debug(
+                "Accept-Encoding %s -> Content-Encoding %s",
+                response.request.headers.get("Accept-Encoding"),
+                response.headers.get("Content-Encoding", "identity"),
+            )
+
+    def is_api_url(self, url: str) -> bool:
+        """Whether url is on the API host, as opposed to e.g. file storage"""
+        target, api = urlsplit(url), urlsplit(self.base_url)
+        return target.scheme == api.scheme and target.netloc.lower() == (
+            api.netloc.lower()
+        )
+
+    def download_headers(self, url: str) -> Dict[str, Optional[str]]:
+        """
+        Request headers for fetching an export file from url
+
+        Export files are usually served from signed storage URLs on another
+        host. The API's token and JSON:API Content-Type are dropped from the
+        session defaults there: the token must not leak, and S3 rejects a
+        presigned URL that also carries an Authorization header.
+        """
+        headers: Dict[str, Optional[str]] = {"Accept": "*/*"}
+        if not self.is_api_url(url):
+            headers.update({"Authorization": None, "Content-Type": None})
+        return headers
+
+    def _reauthenticate_on_401(self, response: requests.Response, *_args, **kwargs):
+        """
+        Log in again and resend a request once if its token was rejected
+
+        Covers a saved token that was revoked or expired early. Concurrent
+        requests rejected with the same token share a single new login.
+        """
+        request = response.request
+        sent_token = request.headers.get("Authorization", "").partition("Bearer ")[2]
+        if (
+            response.status_code != 401
+            or self._credentials is None
+            or getattr(request, "reauthenticated", False)
+            or not self.is_api_url(request.url)
+            or request.url == urljoin(self.base_url, "/oauth/token")
+            # Only requests that carried one of our tokens, e.g. not a
+            # redirect hop requests already stripped the header from
+            or sent_token not in self._issued_tokens
+        ):
+            return response
+
+        with self._auth_lock:
+            if request.headers.get("Authorization") == f"Bearer {self.access_token}":
+                print("  Token rejected by server, authenticating again")
+                self.access_token = None
+                if self.token_path:
+                    try:
+                        self.token_path.unlink()
+                    except OSError:
+                        pass
+                if not self.authenticate(*self._credentials):
+                    return response
+
+        response.close()
+        retry = request.copy()
+        retry.headers["Authorization"] = f"Bearer {self.access_token}"
+        retry.reauthenticated = True
+        return self.session.send(retry, **kwargs)
 
     def authenticate(self, username: str, password: str) -> bool:
         """
         Authenticate using simplified OAuth 2.0 Password Grant flow
         (No client_id or client_secret required for Swimtopia)
+
+        A still-valid token for the same user is reused without a request,
+        as is one saved to token_path by an earlier run.
         """
+        if self.is_token_valid() and self.token_username == username:
+            logger.debug("Reusing token for %s", username)
+            return True
+        self._credentials = (username, password)
+
+        if self.token_path:
+            saved = load_saved_token(self.token_path, self.base_url, username)
+            if saved:
+                self._use_token(username, saved["access_token"], saved["expires_at"])
+                print(f"✓ Reusing saved token ({self.token_path})")
+                return True
+
         token_url = urljoin(self.base_url, "/oauth/token")
 
         # OAuth token request - Swimtopia doesn't require client credentials
@@ -53,29 +423,38 @@ class SwimtopiaExporter:
         }
 
         try:
-            # Use form encoding for OAuth endpoint
-            response = requests.post(
+            # Use form encoding for OAuth endpoint; going through the session
+            # leaves the connection pooled for the API calls that follow
+            response = self.session.post(
                 token_url,
                 data=token_data,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
-                verify=self.verify_ssl,
                 timeout=30,
             )
 
             if response.status_code == 200:
-                token_response = response.json()
-                self.access_token = token_response.get("access_token")
+                token_response = orjson.loads(response.content)
 
                 # Calculate token expiration if provided
                 expires_in = token_response.get("expires_in")
-                if expires_in:
-                    self.token_expires_at = time.time() + expires_in
-
-                # Update session with auth header
-                self.session.headers.update(
-                    {"Authorization": f"Bearer {self.access_token}"}
+                expires_at = time.time() + expires_in if expires_in else None
+                self._use_token(
+                    username, token_response.get("access_token"), expires_at
                 )
 
+                # Only a token with a known expiry can safely outlive this run
+                if self.token_path and self.access_token and expires_at:
+                    try:
+                        save_token(
+                            self.token_path,
+                            self.base_url,
+                            username,
+                            self.access_token,
+                            expires_at,
+                        )
+                    except OSError as e:
+                        print(f"  Warning: could not save token: {e}")
+
                 print(f"✓ Authentication successful")
                 print(f"  Token type: {token_response.get('token_type', 'Bearer')}")
                 if expires_in:
@@ -87,7 +466,7 @@ class SwimtopiaExporter:
 
                 # Try to parse error response
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     if "error" in error_data:
                         print(f"  Error: {error_data.get('error')}")
                         if "error_description" in error_data:
@@ -99,10 +478,20 @@ class SwimtopiaExporter:
 
                 return False
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"✗ Authentication request failed: {e}")
             return False
 
+    def _use_token(
+        self, username: str, access_token: str, expires_at: Optional[float]
+    ) -> None:
+        """Adopt a token and send it with every session request"""
+        self.access_token = access_token
+        self.token_expires_at = expires_at
+        self.token_username = username
+        self._issued_tokens.add(access_token)
+        self.session.headers.update({"Authorization": f"Bearer {access_token}"})
+
     def is_token_valid(self) -> bool:
         """Check if the current token is still valid"""
         if not self.access_token:
@@ -111,6 +500,10 @@ class SwimtopiaExporter:
             return False
         return True
 
+    def export_task_url(self, meet_id: str, task_id: str) -> str:
+        """URL of one export task's status resource"""
+        return f"{self.base_url}/v3/meets/{meet_id}/export-tasks/{task_id}"
+
     def create_export_task(
         self,
         meet_id: str,
@@ -119,97 +512,127 @@ class SwimtopiaExporter:
         team_filter: int = -1,
         session_filter: int = -1,
         task_id: Optional[str] = None,
+        show_progress: bool = True,
     ) -> Optional[str]:
         """
         Create an export task with client-generated UUID
         """
+        say = progress_printer(meet_id, show_progress)
+
         # Generate client-side UUID if not provided
         if not task_id:
-            task_id = str(uuid.uuid4())
+            task_id = new_task_id()
 
         export_url = f"{self.base_url}/v3/meets/{meet_id}/export-tasks"
 
-        # Build request payload
-        payload = {
-            "data": {
-                "type": "exportTask",
-                "id": task_id,
-                "attributes": {
-                    "exportType": export_type,
-                    "exportFormat": export_format,
-                    "exportOptions": {
-                        "team": {
-                            "value": team_filter,
-                            "label": (
-                                "All Teams"
-                                if team_filter == -1
-                                else f"Team {team_filter}"
-                            ),
-                        },
-                        "session": {
-                            "value": session_filter,
-                            "label": (
-                                "All Sessions"
-                                if session_filter == -1
-                                else f"Session {session_filter}"
-                            ),
-                        },
-                    },
-                },
-                "relationships": {
-                    "meet": {"data": {"type": "meet", "id": str(meet_id)}}
-                },
-            }
-        }
-
-        print(f"\n📤 Creating export task...")
-        print(f"   Meet ID: {meet_id}")
-        print(f"   Task ID: {task_id}")
-        print(f"   Export Type: {export_type}")
-        print(f"   Format: {export_format}")
-        print(
-            f"   Team Filter: {'All Teams' if team_filter == -1 else f'Team {team_filter}'}"
+        team_label = "All Teams" if team_filter == -1 else f"Team {team_filter}"
+        session_label = (
+            "All Sessions" if session_filter == -1 else f"Session {session_filter}"
         )
-        print(
-            f"   Session Filter: {'All Sessions' if session_filter == -1 else f'Session {session_filter}'}"
+
+        # Fill in the pre-serialized request payload
+        body = export_task_body(
+            task_id=task_id,
+            export_type=export_type,
+            export_format=export_format,
+            team_value=team_filter,
+            team_label=team_label,
+            session_value=session_filter,
+            session_label=session_label,
+            meet_id=str(meet_id),
         )
 
+        say(f"\n📤 Creating export task...")
+        say(f"   Meet ID: {meet_id}")
+        say(f"   Task ID: {task_id}")
+        say(f"   Export Type: {export_type}")
+        say(f"   Format: {export_format}")
+        say(f"   Team Filter: {team_label}")
+        say(f"   Session Filter: {session_label}")
+
         try:
-            response = self.session.post(export_url, json=payload, timeout=30)
+            response = self.session.post(export_url, data=body, timeout=30)
 
             if response.status_code == 201:
-                print(f"✓ Export task created successfully")
+                say(f"✓ Export task created successfully")
 
                 # Parse response for confirmation
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 created_state = (
                     response_data.get("data", {})
                     .get("attributes", {})
                     .get("currentState")
                 )
-                print(f"  Initial state: {created_state}")
+                say(f"  Initial state: {created_state}")
 
                 return task_id
             else:
-                print(f"✗ Failed to create export task: {response.status_code}")
+                say(f"✗ Failed to create export task: {response.status_code}")
 
                 # Try to parse error response
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     if "errors" in error_data:
                         for error in error_data["errors"]:
-                            print(
+                            say(
                                 f"  Error: {error.get('title', error.get('detail', str(error)))}"
                             )
                 except:
-                    print(f"  Response: {response.text[:500]}")
+                    say(f"  Response: {response.text[:500]}")
 
                 return None
 
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Export task creation failed: {e}")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            say(f"✗ Export task creation failed: {e}")
             return None
 
+    def start_export_task(
+        self, meet_id: str, show_progress: bool = True, **task_options: Any
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Create an export task with its first status request already in flight
+
+        The task ID is generated client-side, so the status GET doesn't have
+        to wait for the POST to return. A 404 or unfinished status from that
+        early request is simply discarded.
+
+        Returns:
+            Task ID (None if creation failed) and the task data if the early
+            status already showed the export completed
+        """
+        say = progress_printer(meet_id, show_progress)
+        task_id = task_options.pop("task_id", None) or new_task_id()
+        status_url = self.export_task_url(meet_id, task_id)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            creation = executor.submit(
+                self.create_export_task,
+                meet_id,
+                task_id=task_id,
+                show_progress=show_progress,
+                **task_options,
+            )
+            early_status = executor.submit(self.session.get, status_url, timeout=30)
+
+        if not creation.result():
+            return None, None
+
+        try:
+            response = early_status.result()
+            if response.status_code != 200:
+                return task_id, None
+            task_data = orjson.loads(response.content).get("data") or {}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return task_id, None
+
+        attributes = task_data.get("attributes") or {}
+        if attributes.get("currentState") != "completed":
+            return task_id, None
+
+        say(f"\n✓ Export completed!")
+        say(f"   Filename: {attributes.get('exportFilename')}")
+        return task_id, task_data
+
     def poll_export_status(
         self,
         meet_id: str,
@@ -217,71 +640,114 @@ class SwimtopiaExporter:
         max_attempts: int = 30,
         poll_interval: float = 2.0,
         show_progress: bool = True,
+        initial_delay: float = POLL_INITIAL_DELAY,
     ) -> Optional[Dict[str, Any]]:
         """
         Poll export task status until completion
+
+        Polls back off exponentially from initial_delay up to
+        poll_interval, or wait as long as the server's Retry-After asks.
+        The status ETag is sent back as If-None-Match so an unchanged task
+        comes back as an empty 304 instead of a body to parse.
         """
-        status_url = f"{self.base_url}/v3/meets/{meet_id}/export-tasks/{task_id}"
+        say = progress_printer(meet_id, show_progress)
+        status_url = self.export_task_url(meet_id, task_id)
 
         if show_progress:
-            print(f"\n⏳ Polling export status...")
+            say(f"\n⏳ Polling export status...")
 
         start_time = time.time()
+        etag = None
+        current_state = None
+        get = self.session.get
+        # Per-attempt lines go to the logger, formatted only if they'll be shown
+        log_progress = show_progress and logger.isEnabledFor(logging.INFO)
 
         for attempt in range(1, max_attempts + 1):
             try:
-                response = self.session.get(status_url, timeout=30)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    task_data = data.get("data", {})
-                    attributes = task_data.get("attributes", {})
+                headers = {"If-None-Match": etag} if etag else None
+                response = get(status_url, headers=headers, timeout=30)
+
+                if (
+                    response.status_code == 200
+                    and not log_progress
+                    and not any(
+                        marker in response.content for marker in TERMINAL_STATE_MARKERS
+                    )
+                ):
+                    # Still running and nobody is watching; skip the parse
+                    etag = response.headers.get("ETag")
+                elif response.status_code == 200:
+                    etag = response.headers.get("ETag")
+                    task_data = orjson.loads(response.content).get("data") or {}
+                    attributes = task_data.get("attributes") or {}
                     current_state = attributes.get("currentState")
 
-                    elapsed = time.time() - start_time
-
-                    if show_progress:
-                        print(
-                            f"   [{elapsed:.1f}s] Attempt {attempt}: State = {current_state}"
+                    if log_progress:
+                        logger.info(
+                            "   [%.1fs] Attempt %d: State = %s",
+                            time.time() - start_time,
+                            attempt,
+                            current_state,
                         )
 
                     if current_state == "completed":
+                        elapsed = time.time() - start_time
                         export_href = attributes.get("exportHref")
                         export_filename = attributes.get("exportFilename")
 
-                        print(f"\n✓ Export completed!")
-                        print(f"   Total time: {elapsed:.1f} seconds")
-                        print(f"   Filename: {export_filename}")
+                        say(f"\n✓ Export completed!")
+                        say(f"   Total time: {elapsed:.1f} seconds")
+                        say(f"   Filename: {export_filename}")
                         if show_progress:
-                            print(f"   Download URL: {export_href[:100]}...")
+                            say(f"   Download URL: {export_href[:100]}...")
 
                         return task_data
 
                     elif current_state == "failed":
-                        print(f"\n✗ Export failed")
+                        say(f"\n✗ Export failed")
                         error_message = attributes.get("errorMessage")
                         if error_message:
-                            print(f"   Error: {error_message}")
+                            say(f"   Error: {error_message}")
                         return None
 
                 elif response.status_code == 304:
                     # Not modified, task still in progress
-                    if show_progress:
-                        elapsed = time.time() - start_time
-                        print(f"   [{elapsed:.1f}s] Attempt {attempt}: No change (304)")
+                    if log_progress:
+                        logger.info(
+                            "   [%.1fs] Attempt %d: No change (304), State = %s",
+                            time.time() - start_time,
+                            attempt,
+                            current_state,
+                        )
+                elif response.status_code in (429, 503):
+                    # Server asked us to slow down; honored below via Retry-After
+                    if log_progress:
+                        logger.info(
+                            "   [%.1fs] Attempt %d: Busy (%d)",
+                            time.time() - start_time,
+                            attempt,
+                            response.status_code,
+                        )
                 else:
-                    print(f"✗ Failed to get status: {response.status_code}")
+                    say(f"✗ Failed to get status: {response.status_code}")
                     return None
 
-            except requests.exceptions.RequestException as e:
-                print(f"✗ Status poll failed: {e}")
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                say(f"✗ Status poll failed: {e}")
                 return None
 
             if attempt < max_attempts:
-                time.sleep(poll_interval)
-
-        print(
-            f"\n✗ Timeout: Export did not complete within {max_attempts * poll_interval} seconds"
+                delay = retry_after_seconds(response)
+                if delay is None:
+                    delay = min(poll_interval, initial_delay * 2 ** (attempt - 1))
+                    delay += random.uniform(0, delay * POLL_JITTER)
+                time.sleep(delay)
+
+        elapsed = time.time() - start_time
+        say(
+            f"\n✗ Timeout: Export did not complete after {max_attempts} attempts"
+            f" ({elapsed:.1f} seconds)"
         )
         return None
 
@@ -290,21 +756,59 @@ class SwimtopiaExporter:
         export_url: str,
         output_dir: str = ".",
         output_filename: Optional[str] = None,
+        show_progress: bool = True,
+        meet_id: Optional[str] = None,
     ) -> Optional[str]:
         """
         Download the exported file
 
+        Without show_progress the body is copied straight from the socket to
+        the file by shutil.copyfileobj, with no per-chunk Python loop.
+
+        A file downloaded before into the same directory under the same name
+        is revalidated with its ETag/Last-Modified, even from a new export
+        URL; on 304 the existing file is returned as is.
+
         Returns:
             Path to downloaded file if successful, None otherwise
         """
-        print(f"\n📥 Downloading export...")
+        say = progress_printer(meet_id, show_progress)
+        say(f"\n📥 Downloading export...")
 
         try:
             # Create output directory if it doesn't exist
             Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-            # Download with streaming to handle large files
-            response = requests.get(export_url, stream=True, timeout=60)
+            # Revalidate an earlier download of the same file, even from a new
+            # URL, if it is still intact
+            cache_path = Path(output_dir) / DOWNLOAD_CACHE_NAME
+            headers = self.download_headers(export_url)
+            cached_path = Path(output_dir) / (
+                output_filename or filename_from_url(export_url)
+            )
+            cached = load_download_cache(cache_path).get(cached_path.name)
+            revalidating = False
+            if (
+                cached
+                and cached_path.is_file()
+                and cached_path.stat().st_size == cached["size"]
+            ):
+                revalidating = True
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            # Download with streaming to handle large files, reusing the
+            # session's pooled connection; the file isn't JSON:API
+            response = self.session.get(
+                export_url, headers=headers, stream=True, timeout=60
+            )
+
+            if response.status_code == 304 and revalidating:
+                response.close()
+                say(f"✓ Unchanged since last download: {cached_path}")
+                return str(cached_path)
 
             if response.status_code == 200:
                 # Get filename from headers or URL if not provided
@@ -317,42 +821,154 @@ class SwimtopiaExporter:
                             1
                         ].strip('"')
                     else:
-                        # Extract from URL
-                        output_filename = export_url.split("/")[-1].split("?")[0]
-                        output_filename = requests.utils.unquote(output_filename)
+                        output_filename = filename_from_url(export_url)
 
                 output_path = Path(output_dir) / output_filename
 
                 # Get total size if available
                 total_size = int(response.headers.get("content-length", 0))
 
-                # Write file with progress
-                downloaded = 0
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            print(
-                                f"\r   Progress: {progress:.1f}% ({downloaded}/{total_size} bytes)",
-                                end="",
-                            )
-
-                print()  # New line after progress
-
-                file_size_mb = output_path.stat().st_size / 1024 / 1024
-                print(f"✓ Downloaded: {output_path} ({file_size_mb:.2f} MB)")
+                if self._can_download_in_parts(response, total_size):
+                    # Drop the single stream and fetch byte ranges side by side
+                    response.close()
+                    say(
+                        f"   Fetching {total_size} bytes in"
+                        f" {PARALLEL_DOWNLOAD_PARTS} parallel parts"
+                    )
+                    downloaded = self._download_in_parts(
+                        export_url, output_path, total_size
+                    )
+                elif not show_progress:
+                    response.raw.decode_content = True
+                    with open_download(output_path, total_size) as f:
+                        shutil.copyfileobj(response.raw, f, DOWNLOAD_COPY_SIZE)
+                        downloaded = f.tell()
+                else:
+                    # Write file with progress
+                    downloaded = 0
+                    next_progress = 0
+                    with open_download(output_path, total_size) as f:
+                        for chunk in response.iter_content(
+                            chunk_size=DOWNLOAD_CHUNK_SIZE
+                        ):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+
+                            if total_size > 0 and (
+                                downloaded >= next_progress or downloaded >= total_size
+                            ):
+                                next_progress = downloaded + PROGRESS_INTERVAL
+                                progress = (downloaded / total_size) * 100
+                                say(
+                                    f"\r   Progress: {progress:.1f}%"
+                                    f" ({downloaded}/{total_size} bytes)",
+                                    end="",
+                                )
+
+                    say()  # New line after progress
+
+                remember_download(cache_path, response, output_path)
+
+                file_size_mb = downloaded / 1024 / 1024
+                say(f"✓ Downloaded: {output_path} ({file_size_mb:.2f} MB)")
                 return str(output_path)
             else:
-                print(f"✗ Download failed: {response.status_code}")
+                say(f"✗ Download failed: {response.status_code}")
                 return None
 
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Download failed: {e}")
+        except (
+            requests.exceptions.RequestException,
+            urllib3.exceptions.HTTPError,
+        ) as e:
+            say(f"✗ Download failed: {e}")
             return None
 
+    def download_many(
+        self, export_urls: List[str], output_dir: str = ".", concurrency: int = 6
+    ) -> Dict[str, Optional[str]]:
+        """
+        Download several exports concurrently over this exporter's session
+
+        Returns:
+            Export URL -> path to the downloaded file, or None if it failed
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            paths = executor.map(
+                lambda export_url: self.download_export(
+                    export_url, output_dir, show_progress=False
+                ),
+                export_urls,
+            )
+            return dict(zip(export_urls, paths))
+
+    @staticmethod
+    def _can_download_in_parts(response: requests.Response, total_size: int) -> bool:
+        """Whether a download is big enough and servable as plain byte ranges"""
+        return (
+            hasattr(os, "pwrite")
+            and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and "Content-Encoding" not in response.headers
+        )
+
+    def _download_in_parts(
+        self, export_url: str, output_path: Path, total_size: int
+    ) -> int:
+        """
+        Download a file as PARALLEL_DOWNLOAD_PARTS concurrent Range requests
+
+        Each part is written at its own offset with os.pwrite into a file
+        sized up front, so parts can land in any order. If any part fails
+        the file is removed.
+
+        Returns:
+            Number of bytes written
+        """
+        part_size = -(-total_size // PARALLEL_DOWNLOAD_PARTS)
+        spans = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+        with open(output_path, "wb") as f:
+            f.truncate(total_size)
+            fd = f.fileno()
+
+            def fetch_part(span):
+                start, end = span
+                with self.session.get(
+                    export_url,
+                    headers={
+                        **self.download_headers(export_url),
+                        "Range": f"bytes={start}-{end}",
+                    },
+                    stream=True,
+                    timeout=60,
+                ) as part:
+                    if part.status_code != 206:
+                        raise requests.exceptions.HTTPError(
+                            f"Range request returned {part.status_code}", response=part
+                        )
+                    offset = start
+                    for chunk in part.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        os.pwrite(fd, chunk, offset)
+                        offset += len(chunk)
+                if offset != end + 1:
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Range {start}-{end} ended early at byte {offset}"
+                    )
+                return offset - start
+
+            try:
+                with ThreadPoolExecutor(max_workers=len(spans)) as executor:
+                    downloaded = sum(executor.map(fetch_part, spans))
+            except BaseException:
+                # The file was sized up front; don't leave it zero-filled
+                output_path.unlink(missing_ok=True)
+                raise
+            sync_data(fd)
+            return downloaded
+
     def list_meets(self, account_id: Optional[str] = None) -> Optional[list]:
         """
         List available meets
@@ -376,7 +992,7 @@ class SwimtopiaExporter:
             response = self.session.get(meets_url, params=params, timeout=30)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 meets = data.get("data", [])
 
                 if not meets:
@@ -405,7 +1021,7 @@ class SwimtopiaExporter:
                 print(f"✗ Failed to list meets: {response.status_code}")
 
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                     if "errors" in error_data:
                         for error in error_data["errors"]:
                             print(
@@ -416,7 +1032,7 @@ class SwimtopiaExporter:
 
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"✗ List meets failed: {e}")
             return None
 
@@ -436,7 +1052,7 @@ class SwimtopiaExporter:
             response = self.session.get(list_url, timeout=30)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 tasks = data.get("data", [])
 
                 print(f"\n📋 Found {len(tasks)} export tasks for meet {meet_id}:")
@@ -453,10 +1069,91 @@ class SwimtopiaExporter:
                 print(f"✗ Failed to list tasks: {response.status_code}")
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"✗ List export tasks failed: {e}")
             return None
 
+    def export_meet(
+        self,
+        meet_id: str,
+        output_dir: Optional[str] = None,
+        max_attempts: int = 30,
+        poll_interval: float = 2.0,
+        show_progress: bool = True,
+        initial_delay: float = POLL_INITIAL_DELAY,
+        **task_options: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the create -> poll -> download pipeline for one meet
+
+        Args:
+            meet_id: ID of the meet to export
+            output_dir: Directory to download into, or None to skip the download
+            task_options: export_type, export_format, team_filter, session_filter
+
+        Returns:
+            Dict with "task_id", "task" data and downloaded "file" (None when
+            the download is skipped), or None if any step failed
+        """
+        task_id, task_data = self.start_export_task(
+            meet_id, show_progress=show_progress, **task_options
+        )
+        if not task_id:
+            return None
+
+        if not task_data:
+            task_data = self.poll_export_status(
+                meet_id,
+                task_id,
+                max_attempts=max_attempts,
+                poll_interval=poll_interval,
+                show_progress=show_progress,
+                initial_delay=initial_delay,
+            )
+        if not task_data:
+            return None
+
+        downloaded_file = None
+        if output_dir is not None:
+            export_url = task_data.get("attributes", {}).get("exportHref")
+            if not export_url:
+                progress_printer(meet_id, show_progress)(
+                    f"✗ No download URL available for meet {meet_id}"
+                )
+                return None
+            # Naming the file up front lets an unchanged export revalidate
+            export_filename = task_data.get("attributes", {}).get("exportFilename")
+            downloaded_file = self.download_export(
+                export_url,
+                output_dir,
+                output_filename=Path(export_filename).name if export_filename else None,
+                show_progress=show_progress,
+                meet_id=meet_id,
+            )
+            if not downloaded_file:
+                return None
+
+        return {"task_id": task_id, "task": task_data, "file": downloaded_file}
+
+    def export_meets(
+        self, meet_ids: List[str], max_workers: int = 4, **export_options: Any
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Export several meets concurrently over this exporter's session
+
+        Each meet runs export_meet() on a worker thread, so one meet's polling
+        and download waits overlap with the others'.
+
+        Returns:
+            Meet ID -> export_meet() result
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda meet_id: self.export_meet(meet_id, **export_options),
+                meet_ids,
+            )
+            return dict(zip(meet_ids, results))
+
 
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load configuration from JSON file"""
@@ -474,6 +1171,7 @@ def load_config(config_file: str) -> Dict[str, Any]:
 
 def main():
     """Main entry point with argument parsing"""
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
 
     parser = argparse.ArgumentParser(description="Export data from Swimtopia")
     parser.add_argument(
@@ -482,7 +1180,12 @@ def main():
         default="config.json",
         help="Configuration file (default: config.json)",
     )
-    parser.add_argument("-m", "--meet-id", help="Override meet ID from config")
+    parser.add_argument(
+        "-m",
+        "--meet-id",
+        nargs="+",
+        help="Override meet ID from config; several IDs are exported concurrently",
+    )
     parser.add_argument(
         "-t",
         "--type",
@@ -506,8 +1209,6 @@ def main():
     config = load_config(args.config)
 
     # Override config with command line arguments
-    if args.meet_id:
-        config["export"]["meet_id"] = args.meet_id
     if args.type:
         config["export"]["export_type"] = args.type
     if args.output:
@@ -517,6 +1218,9 @@ def main():
     exporter = SwimtopiaExporter(
         base_url=config.get("api", {}).get("base_url", "https://api.swimtopia.org"),
         verify_ssl=config.get("api", {}).get("verify_ssl", True),
+        token_path=(
+            TOKEN_CACHE_PATH if config.get("api", {}).get("cache_token", True) else None
+        ),
     )
 
     print("=== Swimtopia Export Script ===\n")
@@ -537,7 +1241,11 @@ def main():
         sys.exit(0 if meets is not None else 1)
 
     export_config = config.get("export", {})
-    meet_id = str(export_config.get("meet_id"))
+    api_config = config.get("api", {})
+    meet_ids = [
+        str(meet_id) for meet_id in args.meet_id or [export_config.get("meet_id")]
+    ]
+    meet_id = meet_ids[0]
 
     # List existing tasks
     if args.list_only:
@@ -545,49 +1253,53 @@ def main():
         tasks = exporter.list_export_tasks(meet_id)
         sys.exit(0)
 
-    # Create new export
-    task_id = exporter.create_export_task(
-        meet_id=meet_id,
-        export_type=export_config.get("export_type", "result"),
-        export_format=export_config.get("export_format", "hy3"),
-        team_filter=export_config.get("team_filter", -1),
-        session_filter=export_config.get("session_filter", -1),
-    )
+    # Options shared by the single- and multi-meet paths
+    export_options = {
+        "output_dir": (
+            None
+            if args.no_download
+            else export_config.get("output_directory", "./exports")
+        ),
+        "max_attempts": api_config.get("max_poll_attempts", 30),
+        "poll_interval": api_config.get("poll_interval_seconds", 2.0),
+        "initial_delay": api_config.get(
+            "poll_initial_delay_seconds", POLL_INITIAL_DELAY
+        ),
+        "export_type": export_config.get("export_type", "result"),
+        "export_format": export_config.get("export_format", "hy3"),
+        "team_filter": export_config.get("team_filter", -1),
+        "session_filter": export_config.get("session_filter", -1),
+    }
+
+    # Export several meets at once
+    if len(meet_ids) > 1:
+        results = exporter.export_meets(
+            meet_ids,
+            max_workers=api_config.get("max_concurrent_exports", 4),
+            show_progress=False,
+            **export_options,
+        )
 
-    if not task_id:
-        print("\n✗ Failed to create export task.")
-        sys.exit(1)
+        print("\n=== Export Summary ===")
+        for result_meet_id, result in results.items():
+            if result is None:
+                print(f"✗ Meet {result_meet_id}: export failed")
+            else:
+                print(
+                    f"✅ Meet {result_meet_id}: {result['file'] or 'download skipped'}"
+                )
+        sys.exit(0 if all(results.values()) else 1)
 
-    # Poll for completion
-    api_config = config.get("api", {})
-    task_data = exporter.poll_export_status(
-        meet_id,
-        task_id,
-        max_attempts=api_config.get("max_poll_attempts", 30),
-        poll_interval=api_config.get("poll_interval_seconds", 2.0),
-    )
+    # Create, poll and download a single meet with progress output
+    result = exporter.export_meet(meet_id, show_progress=True, **export_options)
 
-    if not task_data:
+    if result is None:
         print("\n✗ Export did not complete successfully.")
         sys.exit(1)
 
-    # Download the export
-    if not args.no_download:
-        export_url = task_data.get("attributes", {}).get("exportHref")
-
-        if export_url:
-            output_dir = export_config.get("output_directory", "./exports")
-            downloaded_file = exporter.download_export(export_url, output_dir)
-
-            if downloaded_file:
-                print(f"\n✅ Export complete!")
-                print(f"   File saved to: {downloaded_file}")
-            else:
-                print("\n✗ Download failed.")
-                sys.exit(1)
-        else:
-            print("\n✗ No download URL available.")
-            sys.exit(1)
+    if result["file"]:
+        print(f"\n✅ Export complete!")
+        print(f"   File saved to: {result['file']}")
     else:
         print("\n✅ Export created successfully (download skipped)")
 